@@ -1,7 +1,14 @@
+import concurrent.futures
+import csv
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 
+import numpy as np
 import matplotlib
 matplotlib.use("TkAgg")
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
@@ -9,114 +16,317 @@ from matplotlib.figure import Figure
 
 
 DB_FILE = "students.db"
+STUDENT_PAGE_SIZE = 50  # student rows materialized per scroll step
+
+# CSV import header names (lowercased, spaces/underscores removed) -> student field
+CSV_HEADER_FIELDS = {
+    "studentid": "student_id",
+    "name": "name",
+    "address": "address",
+    "classname": "class_name",
+    "class": "class_name",
+}
 
 
 # -------------------------
 # Database Layer
 # -------------------------
 class StudentDB:
+    # All SQL lives here so the queries can be read and changed in one place
+    _SQL_INSERT_STUDENT = "INSERT INTO students (student_id, name, address, class_name) VALUES (?, ?, ?, ?)"
+    _SQL_DELETE_STUDENT = "DELETE FROM students WHERE id = ?"
+    _SQL_LIST_CLASSES = "SELECT DISTINCT class_name FROM students ORDER BY class_name"
+    _SQL_LIST_BY_CLASS = (
+        "SELECT id, student_id, name, address, class_name FROM students WHERE class_name = ? ORDER BY name"
+    )
+    _SQL_SEARCH_BY_CLASS = (
+        "SELECT id, student_id, name, address, class_name FROM students "
+        "WHERE class_name = ? AND (name LIKE ? ESCAPE '\\' OR student_id LIKE ? ESCAPE '\\') "
+        "ORDER BY name"
+    )
+    _SQL_SEARCH_BY_CLASS_FTS = (
+        "SELECT s.id, s.student_id, s.name, s.address, s.class_name "
+        "FROM students_fts f JOIN students s ON s.id = f.rowid "
+        "WHERE s.class_name = ? AND students_fts MATCH ? "
+        "ORDER BY s.name"
+    )
+    _SQL_GET_STUDENT = "SELECT id, student_id, name, address, class_name FROM students WHERE id = ?"
+    _SQL_INSERT_TERM = "INSERT INTO terms (student_id, term_name, gpa) VALUES (?, ?, ?)"
+    _SQL_LIST_TERMS = "SELECT id, term_name, gpa FROM terms WHERE student_id = ? ORDER BY id"
+    _SQL_DELETE_TERM = "DELETE FROM terms WHERE student_id = ? AND term_name = ?"
+    _SQL_CLASS_STATS = """
+        SELECT s.id, s.name, AVG(t.gpa) as avg_gpa, COUNT(t.id) as term_count
+        FROM students s
+        LEFT JOIN terms t ON t.student_id = s.id
+        WHERE s.class_name = ?
+        GROUP BY s.id
+        ORDER BY s.name
+    """
+
+    READ_POOL_SIZE = 4
+
     def __init__(self, db_path: str = DB_FILE):
-        self.conn = sqlite3.connect(db_path)
-        self.conn.execute("PRAGMA foreign_keys = ON;")
+        # Single writer in autocommit mode: transactions are opened explicitly where they matter
+        self._write_conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._write_lock = threading.Lock()
+        self._write_conn.execute("PRAGMA foreign_keys = ON;")
+        self._write_conn.execute("PRAGMA journal_mode = WAL;")
+        self._write_conn.execute("PRAGMA synchronous = NORMAL;")
+        self._write_conn.execute("PRAGMA temp_store = MEMORY;")
+        self._write_conn.execute("PRAGMA cache_size = -20000;")
+        self._write_conn.execute("PRAGMA mmap_size = 268435456;")
         self._init_schema()
 
+        # Read-only connections, checked out per query so reads can run off the Tk thread
+        ro_uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+        self._read_pool = queue.LifoQueue()
+        for _ in range(self.READ_POOL_SIZE):
+            conn = sqlite3.connect(ro_uri, uri=True, check_same_thread=False)
+            conn.row_factory = sqlite3.Row  # rows support r["name"] as well as unpacking
+            conn.execute("PRAGMA temp_store = MEMORY;")
+            conn.execute("PRAGMA mmap_size = 268435456;")
+            self._read_pool.put(conn)
+
+        # Read caches, invalidated by the write methods below. Reads may run on worker
+        # threads, so a read only fills the cache if no write happened meanwhile.
+        self._stats_cache = {}  # class_name -> class_stats() result
+        self._classes_cache = None  # list_classes() result
+        self._cache_gen = 0
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Run the enclosed writes as one transaction; roll back on error.
+        """
+        with self._write_lock:
+            self._write_conn.execute("BEGIN")
+            try:
+                yield self._write_conn
+            except BaseException:
+                self._write_conn.execute("ROLLBACK")
+                raise
+            self._write_conn.execute("COMMIT")
+
+    @contextmanager
+    def _read(self):
+        """
+        Check out a read-only connection from the pool for the enclosed queries.
+        """
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+
+    def clear_cache(self):
+        self._invalidate()
+
+    def _invalidate(self, class_names=None, classes=True):
+        self._cache_gen += 1
+        if class_names is None:
+            self._stats_cache.clear()
+        else:
+            for class_name in class_names:
+                self._stats_cache.pop(class_name, None)
+        if classes:
+            self._classes_cache = None
+
     def _init_schema(self):
-        self.conn.execute("""
-        CREATE TABLE IF NOT EXISTS students (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            student_id TEXT NOT NULL UNIQUE,
-            name TEXT NOT NULL,
-            address TEXT,
-            class_name TEXT NOT NULL
-        );
-        """)
-        self.conn.execute("""
-        CREATE TABLE IF NOT EXISTS terms (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            student_id INTEGER NOT NULL,
-            term_name TEXT NOT NULL,
-            gpa REAL NOT NULL,
-            FOREIGN KEY(student_id) REFERENCES students(id) ON DELETE CASCADE,
-            UNIQUE(student_id, term_name)
-        );
-        """)
-        self.conn.commit()
+        # One script, one transaction for all of the plain DDL
+        with self._write_lock:
+            self._write_conn.executescript("""
+            BEGIN;
+            CREATE TABLE IF NOT EXISTS students (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                student_id TEXT NOT NULL UNIQUE,
+                name TEXT NOT NULL,
+                address TEXT,
+                class_name TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS terms (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                student_id INTEGER NOT NULL,
+                term_name TEXT NOT NULL,
+                gpa REAL NOT NULL,
+                FOREIGN KEY(student_id) REFERENCES students(id) ON DELETE CASCADE,
+                UNIQUE(student_id, term_name)
+            );
+            -- Class listings/stats filter by class and sort by name; terms are read per student
+            CREATE INDEX IF NOT EXISTS idx_students_class_name ON students(class_name, name);
+            CREATE INDEX IF NOT EXISTS idx_terms_student ON terms(student_id, id);
+            COMMIT;
+            """)
+        self._has_fts = self._init_search_index()
+        # Bound ANALYZE to a sample per index so it stays cheap on large databases
+        self._write_conn.execute("PRAGMA analysis_limit = 400;")
+        self._analyze_if_stale()
+
+    def _analyze_if_stale(self):
+        """
+        Re-ANALYZE when students has no planner stats yet or has doubled since the last run.
+        PRAGMA optimize alone cannot do this: it only considers tables queried on the same
+        connection, and every SELECT here goes through the read pool.
+        """
+        with self._write_lock:
+            conn = self._write_conn
+            count = conn.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+            if not count:
+                return
+            recorded = None
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'").fetchone():
+                row = conn.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = 'students' LIMIT 1").fetchone()
+                if row:
+                    recorded = int(row[0].split()[0])
+            if recorded is None or count >= 2 * recorded:
+                conn.execute("ANALYZE")
+
+    def close(self):
+        """
+        Refresh planner statistics and close all idle connections.
+        """
+        # Readers go first: the last connection to close checkpoints and removes the
+        # WAL, and a read-only one cannot.
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
+        self._analyze_if_stale()
+        with self._write_lock:
+            self._write_conn.execute("PRAGMA optimize;")
+            self._write_conn.close()
+
+    def _init_search_index(self):
+        """
+        Create the FTS5 index used by search, kept in sync with students by triggers.
+        Returns False if this SQLite build lacks FTS5 (search then falls back to LIKE).
+        """
+        try:
+            with self._transaction() as conn:
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'students_fts'"
+                ).fetchone()
+                # trigram keeps the old substring semantics ("lic" finds "Alice")
+                conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS students_fts USING fts5(
+                    name, student_id, content='students', content_rowid='id', tokenize='trigram'
+                );
+                """)
+                conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS students_fts_ai AFTER INSERT ON students BEGIN
+                    INSERT INTO students_fts (rowid, name, student_id) VALUES (new.id, new.name, new.student_id);
+                END;
+                """)
+                conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS students_fts_ad AFTER DELETE ON students BEGIN
+                    INSERT INTO students_fts (students_fts, rowid, name, student_id)
+                    VALUES ('delete', old.id, old.name, old.student_id);
+                END;
+                """)
+                conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS students_fts_au AFTER UPDATE ON students BEGIN
+                    INSERT INTO students_fts (students_fts, rowid, name, student_id)
+                    VALUES ('delete', old.id, old.name, old.student_id);
+                    INSERT INTO students_fts (rowid, name, student_id) VALUES (new.id, new.name, new.student_id);
+                END;
+                """)
+                if not exists:
+                    # Index students that predate the FTS table
+                    conn.execute("INSERT INTO students_fts (students_fts) VALUES ('rebuild');")
+        except sqlite3.OperationalError:
+            return False
+        return True
 
     def add_student(self, student_id: str, name: str, address: str, class_name: str):
-        self.conn.execute(
-            "INSERT INTO students (student_id, name, address, class_name) VALUES (?, ?, ?, ?)",
-            (student_id.strip(), name.strip(), address.strip(), class_name.strip())
-        )
-        self.conn.commit()
+        self.add_students_bulk([(student_id, name, address, class_name)])
+
+    def add_students_bulk(self, rows):
+        """
+        Insert many (student_id, name, address, class_name) rows in one transaction.
+        """
+        with self._transaction() as conn:
+            rows = [(sid.strip(), nm.strip(), (ad or "").strip(), cl.strip()) for sid, nm, ad, cl in rows]
+            conn.executemany(self._SQL_INSERT_STUDENT, rows)
+        self._invalidate({row[3] for row in rows})
 
     def delete_student(self, student_row_id: int):
-        self.conn.execute("DELETE FROM students WHERE id = ?", (student_row_id,))
-        self.conn.commit()
+        with self._transaction() as conn:
+            conn.execute(self._SQL_DELETE_STUDENT, (student_row_id,))
+        self._invalidate()
 
     def list_classes(self):
-        cur = self.conn.execute("SELECT DISTINCT class_name FROM students ORDER BY class_name")
-        return [r[0] for r in cur.fetchall()]
+        classes = self._classes_cache
+        if classes is None:
+            gen = self._cache_gen
+            with self._read() as conn:
+                classes = [r[0] for r in conn.execute(self._SQL_LIST_CLASSES).fetchall()]
+            if gen == self._cache_gen:
+                self._classes_cache = classes
+        return list(classes)
 
     def list_students_by_class(self, class_name: str):
-        cur = self.conn.execute(
-            "SELECT id, student_id, name, address, class_name FROM students WHERE class_name = ? ORDER BY name",
-            (class_name,)
-        )
-        return cur.fetchall()
+        with self._read() as conn:
+            return conn.execute(self._SQL_LIST_BY_CLASS, (class_name,)).fetchall()
 
     def search_students_by_class_like(self, class_name: str, q: str):
-        like = f"%{q.strip()}%"
-        cur = self.conn.execute(
-            "SELECT id, student_id, name, address, class_name FROM students "
-            "WHERE class_name = ? AND (name LIKE ? OR student_id LIKE ?) "
-            "ORDER BY name",
-            (class_name, like, like)
-        )
-        return cur.fetchall()
+        q = q.strip()
+        # Trigram matching needs at least 3 characters; shorter queries use LIKE
+        if self._has_fts and len(q) >= 3:
+            match = '"' + q.replace('"', '""') + '"'
+            with self._read() as conn:
+                return conn.execute(self._SQL_SEARCH_BY_CLASS_FTS, (class_name, match)).fetchall()
+
+        escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        like = f"%{escaped}%"
+        with self._read() as conn:
+            return conn.execute(self._SQL_SEARCH_BY_CLASS, (class_name, like, like)).fetchall()
 
     def get_student(self, student_row_id: int):
-        cur = self.conn.execute(
-            "SELECT id, student_id, name, address, class_name FROM students WHERE id = ?",
-            (student_row_id,)
-        )
-        return cur.fetchone()
+        with self._read() as conn:
+            return conn.execute(self._SQL_GET_STUDENT, (student_row_id,)).fetchone()
 
     def add_term_grade(self, student_row_id: int, term_name: str, gpa: float):
-        self.conn.execute(
-            "INSERT INTO terms (student_id, term_name, gpa) VALUES (?, ?, ?)",
-            (student_row_id, term_name.strip(), float(gpa))
-        )
-        self.conn.commit()
+        self.add_terms_bulk([(student_row_id, term_name, gpa)])
+
+    def add_terms_bulk(self, rows):
+        """
+        Insert many (student_row_id, term_name, gpa) rows in one transaction.
+        """
+        with self._transaction() as conn:
+            conn.executemany(
+                self._SQL_INSERT_TERM,
+                ((row_id, term_name.strip(), float(gpa)) for row_id, term_name, gpa in rows)
+            )
+        self._invalidate(classes=False)
 
     def list_terms_for_student(self, student_row_id: int):
-        cur = self.conn.execute(
-            "SELECT term_name, gpa FROM terms WHERE student_id = ? ORDER BY id",
-            (student_row_id,)
-        )
-        return cur.fetchall()
+        """
+        Return [(term_id, term_name, gpa, gpa_text), ...] with the GPA pre-formatted for display.
+        """
+        with self._read() as conn:
+            rows = conn.execute(self._SQL_LIST_TERMS, (student_row_id,)).fetchall()
+        return [(term_id, term_name, gpa, f"{gpa:.2f}") for term_id, term_name, gpa in rows]
 
     def delete_term(self, student_row_id: int, term_name: str):
-        self.conn.execute(
-            "DELETE FROM terms WHERE student_id = ? AND term_name = ?",
-            (student_row_id, term_name)
-        )
-        self.conn.commit()
+        with self._transaction() as conn:
+            conn.execute(self._SQL_DELETE_TERM, (student_row_id, term_name))
+        self._invalidate(classes=False)
 
     def class_stats(self, class_name: str):
         """
         Return per-student latest average GPA and overall aggregates.
+        Results are cached per class until the next write.
         """
+        cached = self._stats_cache.get(class_name)
+        if cached is not None:
+            return cached
+
+        gen = self._cache_gen
         # Per-student average GPA across terms
-        cur = self.conn.execute("""
-            SELECT s.id, s.name, AVG(t.gpa) as avg_gpa, COUNT(t.id) as term_count
-            FROM students s
-            LEFT JOIN terms t ON t.student_id = s.id
-            WHERE s.class_name = ?
-            GROUP BY s.id
-            ORDER BY s.name
-        """, (class_name,))
-        rows = cur.fetchall()
+        with self._read() as conn:
+            rows = conn.execute(self._SQL_CLASS_STATS, (class_name,)).fetchall()
 
+        # Overall figures come from the same rows: one scan, one snapshot
         gpas = [r[2] for r in rows if r[2] is not None]
         overall = {
             "count_students": len(rows),
@@ -125,6 +335,8 @@ class StudentDB:
             "min_gpa": min(gpas) if gpas else None,
             "max_gpa": max(gpas) if gpas else None,
         }
+        if gen == self._cache_gen:
+            self._stats_cache[class_name] = (rows, overall)
         return rows, overall
 
 
@@ -139,17 +351,29 @@ class StudentSystemApp(tk.Tk):
         self.minsize(1100, 650)
 
         self.db = StudentDB()
+        # Slow reads (class aggregates, term lists) run here, off the Tk thread
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._stats_future = None
+        self._terms_future = None
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # State
         self.selected_class = tk.StringVar(value="")
         self.search_text = tk.StringVar(value="")
         self.selected_student_row_id = None  # internal DB row id
+        self._search_after_id = None  # pending debounced search refresh
+        self._student_rows = []  # full result of the last student query
+        self._student_shown = 0  # how many of those rows are in the tree
+        self._term_iid_to_name = {}  # term_tree iid (DB term id) -> term_name
 
         self._build_ui()
         self._refresh_classes()
         self._set_default_class()
 
     def _build_ui(self):
+        # Fixed row height so Treeview inserts skip per-row font measurement
+        ttk.Style(self).configure("Treeview", rowheight=22)
+
         # Layout: left (dashboard list), right (details + chart)
         root = ttk.Frame(self, padding=10)
         root.pack(fill="both", expand=True)
@@ -190,26 +414,37 @@ class StudentSystemApp(tk.Tk):
         ttk.Label(search_row, text="Search:").grid(row=0, column=0, sticky="w")
         search_entry = ttk.Entry(search_row, textvariable=self.search_text)
         search_entry.grid(row=0, column=1, sticky="ew", padx=(6, 6))
-        search_entry.bind("<KeyRelease>", lambda e: self._refresh_students())
+        search_entry.bind("<KeyRelease>", self._on_search_key)
         ttk.Button(search_row, text="Clear", command=self._clear_search).grid(row=0, column=2)
 
-        # Student list
-        self.student_tree = ttk.Treeview(left, columns=("student_id", "name"), show="headings", height=18)
+        # Student list (rows are materialized page by page as the user scrolls)
+        list_frame = ttk.Frame(left)
+        list_frame.grid(row=3, column=0, sticky="nsew")
+        list_frame.rowconfigure(0, weight=1)
+        list_frame.columnconfigure(0, weight=1)
+
+        self.student_tree = ttk.Treeview(list_frame, columns=("student_id", "name"), show="headings", height=18)
         self.student_tree.heading("student_id", text="Student ID")
         self.student_tree.heading("name", text="Name")
         self.student_tree.column("student_id", width=120, anchor="w")
         self.student_tree.column("name", width=240, anchor="w")
-        self.student_tree.grid(row=3, column=0, sticky="nsew")
+        self.student_tree.grid(row=0, column=0, sticky="nsew")
         self.student_tree.bind("<<TreeviewSelect>>", self._on_student_select)
 
+        self.student_scroll = ttk.Scrollbar(list_frame, orient="vertical", command=self.student_tree.yview)
+        self.student_scroll.grid(row=0, column=1, sticky="ns")
+        self.student_tree.configure(yscrollcommand=self._on_tree_scroll)
+
         # Buttons
         btn_row = ttk.Frame(left)
         btn_row.grid(row=4, column=0, sticky="ew", pady=(10, 0))
         btn_row.columnconfigure(0, weight=1)
         btn_row.columnconfigure(1, weight=1)
+        btn_row.columnconfigure(2, weight=1)
 
         ttk.Button(btn_row, text="Add Student", command=self._open_add_student).grid(row=0, column=0, sticky="ew", padx=(0, 5))
-        ttk.Button(btn_row, text="Delete Student", command=self._delete_selected_student).grid(row=0, column=1, sticky="ew", padx=(5, 0))
+        ttk.Button(btn_row, text="Delete Student", command=self._delete_selected_student).grid(row=0, column=1, sticky="ew", padx=5)
+        ttk.Button(btn_row, text="Import CSV", command=self._import_students_csv).grid(row=0, column=2, sticky="ew", padx=(5, 0))
 
         # -------------------------
         # Right: Student details + terms + chart
@@ -283,18 +518,53 @@ class StudentSystemApp(tk.Tk):
         self.ax.set_title("Term GPA Trend")
         self.ax.set_xlabel("Term")
         self.ax.set_ylabel("GPA")
+        self.ax.set_ylim(0, 4)
+
+        # Artists are created once and updated in place by the plotting helpers. They are
+        # animated (left out of full draws) so updates can be blitted over a saved background.
+        self._line, = self.ax.plot([], [], marker="o", animated=True)
+        self._avg_line = self.ax.axhline(0, linestyle="--", visible=False, animated=True)
+        self._avg_text = self.ax.text(0.02, 0.95, "", transform=self.ax.transAxes, va="top", animated=True)
+        self._chart_bg = None  # axes background saved after the last full draw
+        self._chart_labels = None  # x tick labels currently drawn
 
         self.canvas = FigureCanvasTkAgg(self.figure, master=chart_frame)
+        # Every full draw (including the ones triggered by window resizes) re-grabs the background
+        self.canvas.mpl_connect("draw_event", self._on_chart_draw)
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.grid(row=1, column=0, sticky="nsew", pady=(10, 0))
 
         # Initial empty chart
         self._plot_empty()
 
+    # -------------------------
+    # Background work
+    # -------------------------
+    def _run_in_background(self, fn, arg, callback):
+        """
+        Run fn(arg) on the worker pool; callback(future) is then invoked on the Tk thread.
+        """
+        fut = self._executor.submit(fn, arg)
+        fut.add_done_callback(lambda f: self._post(callback, f))
+        return fut
+
+    def _post(self, callback, *args):
+        try:
+            self.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            pass  # window already closed
+
+    def _on_close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.db.close()
+        self.destroy()
+
     # -------------------------
     # UI Actions
     # -------------------------
     def _refresh_all(self):
+        # Explicit refresh: pick up changes made outside this app too
+        self.db.clear_cache()
         self._refresh_classes()
         self._refresh_students()
         self._refresh_class_stats()
@@ -315,6 +585,16 @@ class StudentSystemApp(tk.Tk):
         self.search_text.set("")
         self._refresh_students()
 
+    def _on_search_key(self, _event):
+        # Coalesce bursts of keystrokes into a single refresh
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(150, self._do_search_refresh)
+
+    def _do_search_refresh(self):
+        self._search_after_id = None
+        self._refresh_students()
+
     def _refresh_students(self):
         class_name = self.selected_class.get().strip()
         if not class_name:
@@ -322,26 +602,87 @@ class StudentSystemApp(tk.Tk):
 
         q = self.search_text.get().strip()
 
-        for item in self.student_tree.get_children():
-            self.student_tree.delete(item)
-
         if q:
             rows = self.db.search_students_by_class_like(class_name, q)
         else:
             rows = self.db.list_students_by_class(class_name)
 
-        for (row_id, student_id, name, address, class_name) in rows:
-            # store internal row_id in iid
-            self.student_tree.insert("", "end", iid=str(row_id), values=(student_id, name))
+        self._student_rows = rows
+        shown = STUDENT_PAGE_SIZE
+
+        # Keep the selected student materialized even if it sits past the first page
+        selection = self.student_tree.selection()
+        if selection:
+            for index, row in enumerate(rows):
+                if f"{row['id']}" == selection[0]:
+                    shown = max(shown, index + 1)
+                    break
+
+        self._student_shown = min(shown, len(rows))
+        self._sync_student_window()
 
         self._refresh_class_stats()
 
+    def _sync_student_window(self):
+        # store internal row_id in iid
+        self._sync_tree(
+            self.student_tree,
+            [(f"{r['id']}", (r["student_id"], r["name"])) for r in self._student_rows[:self._student_shown]]
+        )
+
+    def _on_tree_scroll(self, lo, hi):
+        self.student_scroll.set(lo, hi)
+        # Near the bottom of what is materialized: pull in the next page
+        if float(hi) >= 0.9 and self._student_shown < len(self._student_rows):
+            self._student_shown = min(self._student_shown + STUDENT_PAGE_SIZE, len(self._student_rows))
+            self._sync_student_window()
+
+    def _sync_tree(self, tree, items):
+        """
+        Bring a flat Treeview in line with ``items`` ([(iid, values), ...]),
+        touching only rows that were removed, added, changed or moved.
+        """
+        wanted = dict(items)
+        stale = set(tree.get_children("")) - wanted.keys()
+        if stale:
+            tree.delete(*stale)
+
+        # Mirror of the tree's child order, kept in step with each move/insert
+        current = list(tree.get_children(""))
+        present = set(current)
+
+        # Hoist bound methods out of the per-row loop
+        insert, item, move = tree.insert, tree.item, tree.move
+        for index, (iid, values) in enumerate(items):
+            if iid in present:
+                # Tk hands values back as strings (or numbers), so compare as text
+                if tuple(map(str, item(iid, "values"))) != tuple(map(str, values)):
+                    item(iid, values=values)
+                if current[index] != iid:
+                    move(iid, "", index)
+                    current.remove(iid)
+                    current.insert(index, iid)
+            else:
+                insert("", index, iid=iid, values=values)
+                current.insert(index, iid)
+                present.add(iid)
+
     def _refresh_class_stats(self):
         class_name = self.selected_class.get().strip()
         if not class_name:
             return
 
-        per_student, overall = self.db.class_stats(class_name)
+        self._stats_future = self._run_in_background(
+            self.db.class_stats, class_name,
+            lambda f: self._apply_class_stats(class_name, f)
+        )
+
+    def _apply_class_stats(self, class_name: str, fut):
+        # Drop results superseded by a newer request or a class change
+        if fut is not self._stats_future or class_name != self.selected_class.get().strip():
+            return
+
+        per_student, overall = fut.result()
         if overall["avg_gpa"] is None:
             text = f"Class '{class_name}': {overall['count_students']} students (no term grades yet)."
         else:
@@ -364,15 +705,27 @@ class StudentSystemApp(tk.Tk):
         st = self.db.get_student(student_row_id)
         if not st:
             return
-        _, student_id, name, address, class_name = st
+        self.lbl_student_id.config(text=f"Student ID: {st['student_id']}")
+        self.lbl_name.config(text=f"Name: {st['name']}")
+        self.lbl_address.config(text=f"Address: {st['address'] or '-'}")
+        self.lbl_class.config(text=f"Class: {st['class_name']}")
+
+        self._load_terms(student_row_id)
+
+    def _load_terms(self, student_row_id: int):
+        # One query feeds both the term list and the chart
+        self._terms_future = self._run_in_background(
+            self.db.list_terms_for_student, student_row_id,
+            lambda f: self._apply_terms(student_row_id, f)
+        )
 
-        self.lbl_student_id.config(text=f"Student ID: {student_id}")
-        self.lbl_name.config(text=f"Name: {name}")
-        self.lbl_address.config(text=f"Address: {address or '-'}")
-        self.lbl_class.config(text=f"Class: {class_name}")
+    def _apply_terms(self, student_row_id: int, fut):
+        if fut is not self._terms_future or student_row_id != self.selected_student_row_id:
+            return
 
-        self._refresh_terms(student_row_id)
-        self._plot_student(student_row_id)
+        terms = fut.result()
+        self._refresh_terms(student_row_id, terms)
+        self._plot_student(student_row_id, terms)
 
     def _clear_student_details(self):
         self.selected_student_row_id = None
@@ -383,6 +736,7 @@ class StudentSystemApp(tk.Tk):
 
         for item in self.term_tree.get_children():
             self.term_tree.delete(item)
+        self._term_iid_to_name = {}
         self._plot_empty()
 
     def _open_add_student(self):
@@ -446,6 +800,73 @@ class StudentSystemApp(tk.Tk):
         ttk.Button(btns, text="Cancel", command=dialog.destroy).grid(row=0, column=0, sticky="ew", padx=(0, 6))
         ttk.Button(btns, text="Add", command=on_add).grid(row=0, column=1, sticky="ew", padx=(6, 0))
 
+    def _import_students_csv(self):
+        path = filedialog.askopenfilename(
+            title="Import Students",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+
+        # The first non-blank row must be a header; columns are mapped by name
+        students = []
+        error = None
+        try:
+            with open(path, newline="", encoding="utf-8-sig") as f:
+                reader = csv.reader(f)
+                columns = None
+                for r in reader:
+                    if not r:
+                        continue
+                    # line_num is the file line the row ended on
+                    if columns is None:
+                        keys = [CSV_HEADER_FIELDS.get(c.strip().lower().replace(" ", "").replace("_", "")) for c in r]
+                        known = [k for k in keys if k]
+                        missing = {"student_id", "name", "class_name"} - set(known)
+                        if missing or len(set(known)) != len(known):
+                            error = (
+                                f"Line {reader.line_num}: the first row must be a header with "
+                                "Student ID, Name and Class columns (Address optional), each listed once."
+                            )
+                            break
+                        columns = keys
+                        continue
+                    if len(r) != len(columns):
+                        error = f"Line {reader.line_num}: expected {len(columns)} fields, found {len(r)}."
+                        break
+                    rec = {k: v for k, v in zip(columns, r) if k}
+                    if not rec["student_id"].strip() or not rec["name"].strip() or not rec["class_name"].strip():
+                        error = f"Line {reader.line_num}: Student ID, Name, and Class are required."
+                        break
+                    students.append((rec["student_id"], rec["name"], rec.get("address", ""), rec["class_name"]))
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to read file:\n{e}")
+            return
+
+        if error is not None:
+            messagebox.showerror("Validation", error)
+            return
+
+        if not students:
+            messagebox.showinfo("Import CSV", "No students found in file.")
+            return
+
+        try:
+            self.db.add_students_bulk(students)
+        except sqlite3.IntegrityError:
+            messagebox.showerror("Duplicate", "The file contains a Student ID that already exists. Nothing was imported.")
+            return
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to import students:\n{e}")
+            return
+
+        messagebox.showinfo("Import CSV", f"Imported {len(students)} students.")
+        self._refresh_classes()
+        if not self.selected_class.get().strip():
+            self._set_default_class()
+        else:
+            self._refresh_students()
+
     def _delete_selected_student(self):
         selection = self.student_tree.selection()
         if not selection:
@@ -457,8 +878,7 @@ class StudentSystemApp(tk.Tk):
         if not st:
             return
 
-        _, student_id, name, _, _ = st
-        if not messagebox.askyesno("Confirm Delete", f"Delete student '{name}' (ID: {student_id})?\nThis also deletes all term grades."):
+        if not messagebox.askyesno("Confirm Delete", f"Delete student '{st['name']}' (ID: {st['student_id']})?\nThis also deletes all term grades."):
             return
 
         try:
@@ -470,13 +890,15 @@ class StudentSystemApp(tk.Tk):
         self._refresh_students()
         self._clear_student_details()
 
-    def _refresh_terms(self, student_row_id: int):
-        for item in self.term_tree.get_children():
-            self.term_tree.delete(item)
-
-        terms = self.db.list_terms_for_student(student_row_id)
-        for term_name, gpa in terms:
-            self.term_tree.insert("", "end", iid=term_name, values=(term_name, f"{gpa:.2f}"))
+    def _refresh_terms(self, student_row_id: int, terms=None):
+        if terms is None:
+            terms = self.db.list_terms_for_student(student_row_id)
+        self._sync_tree(
+            self.term_tree,
+            [(f"{t[0]}", (t[1], t[3])) for t in terms]
+        )
+        # Term rows are keyed by DB id; keep the name for delete/confirm messages
+        self._term_iid_to_name = {f"{t[0]}": t[1] for t in terms}
 
     def _add_term(self):
         if self.selected_student_row_id is None:
@@ -510,8 +932,7 @@ class StudentSystemApp(tk.Tk):
 
         self.term_name_var.set("")
         self.term_gpa_var.set("")
-        self._refresh_terms(self.selected_student_row_id)
-        self._plot_student(self.selected_student_row_id)
+        self._load_terms(self.selected_student_row_id)
         self._refresh_class_stats()
 
     def _delete_selected_term(self):
@@ -524,7 +945,9 @@ class StudentSystemApp(tk.Tk):
             messagebox.showinfo("Delete Term", "Select a term to delete.")
             return
 
-        term_name = selection[0]
+        term_name = self._term_iid_to_name.get(selection[0])
+        if term_name is None:
+            return
         if not messagebox.askyesno("Confirm", f"Delete term '{term_name}'?"):
             return
 
@@ -534,47 +957,65 @@ class StudentSystemApp(tk.Tk):
             messagebox.showerror("Error", f"Failed to delete term:\n{e}")
             return
 
-        self._refresh_terms(self.selected_student_row_id)
-        self._plot_student(self.selected_student_row_id)
+        self._load_terms(self.selected_student_row_id)
         self._refresh_class_stats()
 
     # -------------------------
     # Plotting
     # -------------------------
-    def _plot_empty(self):
-        self.ax.clear()
-        self.ax.set_title("Term GPA Trend")
-        self.ax.set_xlabel("Term")
-        self.ax.set_ylabel("GPA")
-        self.ax.set_ylim(0, 4)
-        self.canvas.draw()
+    def _on_chart_draw(self, _event):
+        self._chart_bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_chart_artists()
+
+    def _draw_chart_artists(self):
+        for artist in (self._line, self._avg_line, self._avg_text):
+            self.ax.draw_artist(artist)
+
+    def _update_chart(self, x_labels):
+        # Ticks live outside the axes box, so a label change needs a full draw
+        if x_labels != self._chart_labels or self._chart_bg is None:
+            self._chart_labels = x_labels
+            self.canvas.draw_idle()
+            return
 
-    def _plot_student(self, student_row_id: int):
-        terms = self.db.list_terms_for_student(student_row_id)
+        self.canvas.restore_region(self._chart_bg)
+        self._draw_chart_artists()
+        self.canvas.blit(self.ax.bbox)
 
-        self.ax.clear()
-        self.ax.set_title("Term GPA Trend")
-        self.ax.set_xlabel("Term")
-        self.ax.set_ylabel("GPA")
-        self.ax.set_ylim(0, 4)
+    def _plot_empty(self):
+        self._line.set_data([], [])
+        if self._chart_labels != []:
+            self.ax.set_xticks([])
+        self._avg_line.set_visible(False)
+        self._avg_text.set_text("")
+        self._update_chart([])
+
+    def _plot_student(self, student_row_id: int, terms=None):
+        if terms is None:
+            terms = self.db.list_terms_for_student(student_row_id)
 
         if not terms:
-            self.canvas.draw()
+            self._plot_empty()
             return
 
-        x_labels = [t[0] for t in terms]
-        y_vals = [t[1] for t in terms]
+        x_labels = [t[1] for t in terms]
+        y_vals = np.fromiter((t[2] for t in terms), dtype=np.float64, count=len(terms))
+        x_vals = np.arange(y_vals.size)
 
-        self.ax.plot(range(len(x_labels)), y_vals, marker="o")
-        self.ax.set_xticks(range(len(x_labels)))
-        self.ax.set_xticklabels(x_labels, rotation=30, ha="right")
+        self._line.set_data(x_vals, y_vals)
+        if x_labels != self._chart_labels:
+            self.ax.set_xticks(x_vals)
+            self.ax.set_xticklabels(x_labels, rotation=30, ha="right")
+            self.ax.relim()
+            self.ax.autoscale_view(scaley=False)
 
         # Simple performance annotation
-        avg = sum(y_vals) / len(y_vals)
-        self.ax.axhline(avg, linestyle="--")
-        self.ax.text(0.02, 0.95, f"Avg: {avg:.2f}", transform=self.ax.transAxes, va="top")
+        avg = float(y_vals.mean())
+        self._avg_line.set_ydata([avg, avg])
+        self._avg_line.set_visible(True)
+        self._avg_text.set_text(f"Avg: {avg:.2f}")
 
-        self.canvas.draw()
+        self._update_chart(x_labels)
 
 
 if __name__ == "__main__":